@@ -46,6 +46,13 @@ class TypeConfigurationManager:
         """
         # NOTE: The errors raised need to be improved.
 
+        # Dispatch table from definition key to the method that adds it.
+        add_definition = {
+            constants.NEW_FIELD_TYPE: self.add_field_def,
+            constants.NEW_NOTE_TYPE: self.add_note_def,
+            constants.NEW_COLLECTION_TYPE: self.add_collection_def,
+        }
+
         for definition in definitions:
 
             if not isinstance(definition, dict):
@@ -54,20 +61,16 @@ class TypeConfigurationManager:
             if len(definition) != 1:
                 raise ValueError("Malformed definition.")
 
-            def_key = list(definition.keys())[0]
+            def_key = next(iter(definition))
 
             if not isinstance(definition[def_key], dict):
                 raise ValueError("Malformed definition.")
 
-            if def_key == constants.NEW_FIELD_TYPE:
-                self.add_field_def(definition[def_key])
-            elif def_key == constants.NEW_NOTE_TYPE:
-                self.add_note_def(definition[def_key])
-            elif def_key == constants.NEW_COLLECTION_TYPE:
-                self.add_collection_def(definition[def_key])
-            else:
+            if def_key not in add_definition:
                 raise ValueError("Malformed definition.")
 
+            add_definition[def_key](definition[def_key])
+
 
     def add_field_def(self, definition: dict) -> None:
         """Validate and add a field definition.
@@ -23,7 +23,7 @@ from typing import Any
 import constants
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FieldTypeDefinition:
     """A field type read from initial description.
 
@@ -52,7 +52,7 @@ class FieldTypeDefinition:
 
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NoteTypeDefinition:
     """A note type definition read from initial description.
 
@@ -75,7 +75,7 @@ class NoteTypeDefinition:
     body_specification: dict | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CollectionTypeDefinition:
     """A collection type definition read from initial description.
 
@@ -100,7 +100,7 @@ class CollectionTypeDefinition:
     note_types_allowed: list[str | dict] | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class FieldType:
     """A field type in the system.
 
@@ -110,7 +110,7 @@ class FieldType:
     pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class NoteType:
     """A note type in the system.
 
@@ -120,7 +120,7 @@ class NoteType:
     pass
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class CollectionType:
     """A collection type in the system.
 
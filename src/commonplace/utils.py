@@ -17,6 +17,12 @@ import uuid
 # Third party imports
 import yaml
 
+try:
+    # Use the libyaml bindings when PyYAML has been built with them.
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # Local imports
 
 
@@ -33,7 +39,7 @@ def return_yaml_list(file_path: str) -> list[dict]:
     """
     yaml_list = list()
     with open(file_path, 'r') as file:
-        data = yaml.safe_load_all(file)
+        data = yaml.load_all(file, Loader=SafeLoader)
         for doc in data:
             yaml_list.append(doc)
     return yaml_list